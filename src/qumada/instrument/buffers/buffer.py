@@ -28,6 +28,10 @@ from qcodes.instrument import Instrument
 from qcodes.metadatable import Metadatable
 from qcodes.parameters import Parameter
 
+# Buffer settings that together (over)define the number of points of a buffered measurement
+_NUM_POINTS_KEYS = frozenset(("sampling_rate", "burst_duration", "num_points"))
+_RATE_DURATION_KEYS = frozenset(("sampling_rate", "burst_duration"))
+
 
 def is_bufferable(object: Instrument | Parameter):
     """Checks if the instrument or parameter is bufferable using the qumada Buffer definition."""
@@ -167,6 +171,8 @@ def map_triggers(
 class Buffer(ABC):
     """Base class for a general buffer interface for an instrument."""
 
+    __slots__ = ()
+
     SETTING_NAMES: set[str] = {
         "trigger_mode",
         "trigger_threshold",
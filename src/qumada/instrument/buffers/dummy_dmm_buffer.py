@@ -30,6 +30,7 @@ from jsonschema import validate
 from qcodes.parameters import Parameter
 
 from qumada.instrument.buffers import Buffer, BufferException
+from qumada.instrument.buffers.buffer import _NUM_POINTS_KEYS, _RATE_DURATION_KEYS
 from qumada.instrument.custom_drivers.Dummies.dummy_dmm import DummyDmm
 
 
@@ -37,6 +38,16 @@ from qumada.instrument.custom_drivers.Dummies.dummy_dmm import DummyDmm
 class DummyDMMBuffer(Buffer):
     """Buffer for Dummy DMM"""
 
+    __slots__ = (
+        "_device",
+        "_trigger",
+        "_subscribed_parameters",
+        "_num_points",
+        "settings",
+        "delay",
+        "delay_data_points",
+    )
+
     AVAILABLE_TRIGGERS: list[str] = ["software"]
 
     def __init__(self, device: DummyDmm):
@@ -91,11 +102,11 @@ class DummyDMMBuffer(Buffer):
         -------
         None
         """
-        if all(k in self.settings for k in ("sampling_rate", "burst_duration", "num_points")):
+        if self.settings.keys() >= _NUM_POINTS_KEYS:
             raise BufferException("You cannot define sampling_rate, burst_duration and num_points at the same time")
         elif self.settings.get("num_points", False):
             self.num_points = self.settings["num_points"]
-        elif all(k in self.settings for k in ("sampling_rate", "burst_duration")):
+        elif self.settings.keys() >= _RATE_DURATION_KEYS:
             self.num_points = int(np.ceil(self.settings["sampling_rate"] * self.settings["burst_duration"]))
 
     @property
@@ -21,20 +21,40 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 import numpy as np
 from jsonschema import validate
 from qcodes.parameters import Parameter
 
-from qumada.instrument.buffers.buffer import Buffer, BufferException
+from qumada.instrument.buffers.buffer import _NUM_POINTS_KEYS, Buffer, BufferException
 from qumada.instrument.custom_drivers.ZI.MFLI import MFLI
 
 logger = logging.getLogger(__name__)
 
+# Combinations of buffer settings that overdefine the measurement
+_RATE_BURSTS_POINTS_KEYS = frozenset(("sampling_rate", "duration", "num_bursts", "num_points"))
+_BURSTS_DURATION_KEYS = frozenset(("num_bursts", "duration", "burst_duration"))
+
 
 class MFLIBuffer(Buffer):
     """Buffer for ZurichInstruments MFLI"""
 
+    __slots__ = (
+        "_session",
+        "_device",
+        "_daq",
+        "_node_by_param",
+        "_param_by_nodestr",
+        "_trigger",
+        "_channel",
+        "_num_points",
+        "_num_bursts",
+        "_burst_duration",
+        "_sampling_rate",
+        "settings",
+    )
+
     AVAILABLE_TRIGGERS: list[str] = [
         "trigger_in_1",
         "trigger_in_2",
@@ -60,8 +80,8 @@ class MFLIBuffer(Buffer):
         self._session = mfli.session
         self._device = mfli.instr
         self._daq = self._session.modules.daq
-        self._sample_nodes: list = []
-        self._subscribed_parameters: list[Parameter] = []
+        self._node_by_param: dict[Parameter, Any] = {}
+        self._param_by_nodestr: dict[str, Parameter] = {}
         self._trigger: str | None = None
         self._channel = 0
         self._num_points: int | None = None
@@ -88,8 +108,11 @@ class MFLIBuffer(Buffer):
         if "trigger_threshold" in settings:
             # TODO: better way to distinguish, which trigger level to set
             self._daq.level(settings["trigger_threshold"])
-            self._device.triggers.in_[0].level(settings["trigger_threshold"])
-            self._device.triggers.in_[1].level(settings["trigger_threshold"])
+            # Bundle both device node writes into one transaction (one round-trip to the data server).
+            # The DAQ module node above is not a device node and cannot be part of it.
+            with self._device.set_transaction():
+                self._device.triggers.in_[0].level(settings["trigger_threshold"])
+                self._device.triggers.in_[1].level(settings["trigger_threshold"])
         else:
             logger.warning("No trigger threshold specified!")
         self._set_num_points()
@@ -159,15 +182,15 @@ class MFLIBuffer(Buffer):
         """
         # TODO: Include ._daq.repetitions (averages over multiple bursts)
 
-        if all(k in self.settings for k in ("sampling_rate", "burst_duration", "num_points")):
+        if self.settings.keys() >= _NUM_POINTS_KEYS:
             raise BufferException("You cannot define sampling_rate, burst_duration and num_points at the same time")
 
-        if all(k in self.settings for k in ("sampling_rate", "duration", "num_bursts", "num_points")):
+        if self.settings.keys() >= _RATE_BURSTS_POINTS_KEYS:
             raise BufferException(
                 "You cannot define sampling rate, duration and num_burst and num_points at the same time"
             )
 
-        if all(k in self.settings for k in ("num_bursts", "duration", "burst_duration")):
+        if self.settings.keys() >= _BURSTS_DURATION_KEYS:
             raise BufferException("You cannnot define duration, burst_duration and num_bursts at the same time")
 
         if "burst_duration" in self.settings:
@@ -195,22 +218,41 @@ class MFLIBuffer(Buffer):
             self._sampling_rate = float(self.settings["sampling_rate"])
             if self._burst_duration is not None:
                 self.num_points = int(np.ceil(self._sampling_rate * self._burst_duration))
-            elif all(k in self.settings for k in ("duration", "num_bursts")):
+            elif "duration" in self.settings and "num_bursts" in self.settings:
                 self._burst_duration = float(self.settings["duration"] / self.settings["num_bursts"])
 
         self._daq.count(self._num_bursts)
         self._daq.duration(self._burst_duration)
         self._daq.grid.cols(self.num_points)
 
+    @property
+    def _subscribed_parameters(self) -> list[Parameter]:
+        return list(self._node_by_param)
+
     def read(self) -> dict:
+        return self.read_numpy()
+
+    def read_numpy(self) -> dict[str, np.ndarray]:
+        """
+        Read the buffer without copying the data.
+
+        The returned arrays wrap the data returned by the DAQ module. As the module returns new arrays
+        on every read, they stay valid after later readouts.
+        """
         data = self.read_raw()
         result_dict = {}
-        for parameter in self._subscribed_parameters:
-            node = self._get_node_from_parameter(parameter)
-            key = next(key for key in data.keys() if str(key) == str(node))
-            result_dict[parameter.name] = data[key][0].value
-            if "timestamps" not in result_dict:
-                result_dict["timestamps"] = data[key][0].time
+        timestamps = None
+        # Single pass over the returned nodes; all subscribed nodes share the same grid timestamps.
+        for key, samples in data.items():
+            parameter = self._param_by_nodestr.get(key)
+            if parameter is None:
+                continue
+            sample = samples[0]
+            result_dict[parameter.name] = np.asarray(sample.value)
+            if timestamps is None:
+                timestamps = np.asarray(sample.time)
+        if timestamps is not None:
+            result_dict["timestamps"] = timestamps
         return result_dict
 
     def read_raw(self) -> dict:
@@ -219,21 +261,21 @@ class MFLIBuffer(Buffer):
     def subscribe(self, parameters: list[Parameter]) -> None:
         for parameter in parameters:
             node = self._get_node_from_parameter(parameter)
-            if node not in self._sample_nodes:
-                self._subscribed_parameters.append(parameter)
-                self._sample_nodes.append(node)
+            node_str = str(node)
+            if node_str not in self._param_by_nodestr:
+                self._node_by_param[parameter] = node
+                self._param_by_nodestr[node_str] = parameter
                 self._daq.subscribe(node)
 
     def unsubscribe(self, parameters: list[Parameter]) -> None:
         for parameter in parameters.copy():
-            node = self._get_node_from_parameter(parameter)
-            if node in self._sample_nodes:
-                self._sample_nodes.remove(node)
-                self._subscribed_parameters.remove(parameter)
+            node = self._node_by_param.pop(parameter, None)
+            if node is not None:
+                del self._param_by_nodestr[str(node)]
                 self._daq.unsubscribe(node)
 
     def is_subscribed(self, parameter: Parameter) -> bool:
-        return parameter in self._subscribed_parameters
+        return parameter in self._node_by_param
 
     def start(self) -> None:
         self._daq.execute()
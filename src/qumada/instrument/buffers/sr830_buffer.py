@@ -26,21 +26,41 @@ from pyvisa import VisaIOError
 from qcodes.instrument_drivers.stanford_research.SR830 import SR830
 from qcodes.parameters import Parameter
 
-from qumada.instrument.buffers.buffer import Buffer, BufferException
+from qumada.instrument.buffers.buffer import (
+    _NUM_POINTS_KEYS,
+    _RATE_DURATION_KEYS,
+    Buffer,
+    BufferException,
+)
 
 
 class SR830Buffer(Buffer):
     """Buffer for Stanford SR830"""
 
+    __slots__ = (
+        "_device",
+        "_trigger",
+        "_ch_slots",
+        "_trace_getters",
+        "_num_points",
+        "settings",
+        "delay",
+        "delay_data_points",
+    )
+
     ch1_names = ["X", "R", "X Noise", "aux_in1", "aux_in2"]
     ch2_names = ["Y", "Phase", "Y Noise", "aux_in3", "aux_in4"]
+    _ch1_set = frozenset(ch1_names)
+    _ch2_set = frozenset(ch2_names)
 
     AVAILABLE_TRIGGERS: list[str] = ["external", "trig_in_1"]
 
     def __init__(self, device: SR830):
         self._device = device
         self._trigger: str | None = None
-        self._subscribed_parameters: set[Parameter] = set()
+        # Each channel buffers exactly one parameter at a time
+        self._ch_slots: dict[str, Parameter | None] = {"ch1": None, "ch2": None}
+        self._trace_getters: dict[str, Parameter] = {}  # datatrace parameter per channel
         self._num_points: int | None = None
 
     def setup_buffer(self, settings: dict) -> None:
@@ -63,6 +83,10 @@ class SR830Buffer(Buffer):
             self.num_points = self.delay_data_points + self.num_points
             # TODO: There has to be a more elegant way for the setter.
 
+    @property
+    def _subscribed_parameters(self) -> set[Parameter]:
+        return {parameter for parameter in self._ch_slots.values() if parameter is not None}
+
     @property
     def num_points(self) -> int | None:
         return self._num_points
@@ -88,7 +112,7 @@ class SR830Buffer(Buffer):
         -------
         None
         """
-        if all(k in self.settings for k in ("sampling_rate", "burst_duration", "num_points")):
+        if self.settings.keys() >= _NUM_POINTS_KEYS:
             raise BufferException("You cannot define sampling_rate, burst_duration and num_points at the same time")
         elif self.settings.get("num_points", False):
             self.num_points = self.settings["num_points"]
@@ -96,7 +120,7 @@ class SR830Buffer(Buffer):
                 self._device.buffer_SR(self.settings["sampling_rate"])
             else:
                 self._device.buffer_SR(self.num_points / self.settings["burst_duration"])
-        elif all(k in self.settings for k in ("sampling_rate", "burst_duration")):
+        elif self.settings.keys() >= _RATE_DURATION_KEYS:
             self.num_points = int(np.ceil(self.settings["sampling_rate"] * self.settings["burst_duration"]))
 
     @property
@@ -107,16 +131,20 @@ class SR830Buffer(Buffer):
     def trigger(self, trigger: str | None) -> None:
         if trigger == "trig_in_1":
             # TODO: standard value for Sample Rate
-            self._device.buffer_SR(512)
-            self._device.buffer_trig_mode("OFF")
+            sample_rate, trig_mode = 512, "OFF"
         elif trigger == "external":
-            self._device.buffer_SR("Trigger")
-            self._device.buffer_trig_mode("ON")
+            sample_rate, trig_mode = "Trigger", "ON"
         else:
             raise BufferException(
                 "SR830 does not support setting custom trigger inputs. "
                 "Use 'external' and the input on the back of the unit."
             )
+        try:
+            self._device.buffer_SR(sample_rate)
+            self._device.buffer_trig_mode(trig_mode)
+        except VisaIOError as ex:
+            raise BufferException(f"Could not set trigger '{trigger}' on the SR830.") from ex
+        # Only remember the trigger once the device has accepted both settings
         self._trigger = trigger
 
     def force_trigger(self) -> None:
@@ -124,16 +152,15 @@ class SR830Buffer(Buffer):
 
     def read_raw(self) -> dict:
         # TODO: Handle stopping buffer or not
+        # Traces are read one after another on purpose: both go through the same VISA session
+        # (write TRCL?, then read_raw), so concurrent queries would interleave the responses.
         data = {}
         try:
-            for parameter in self._subscribed_parameters:
-                if parameter.name in self.ch1_names:
-                    ch = "ch1"
-                elif parameter.name in self.ch2_names:
-                    ch = "ch2"
-
+            for ch, parameter in self._ch_slots.items():
+                if parameter is None:
+                    continue
                 # TODO: what structure has the data? do we get timestamps?
-                data[parameter.name] = self._device.__getattr__(f"{ch}_datatrace").get()
+                data[parameter.name] = self._trace_getters[ch].get()
                 data[parameter.name] = data[parameter.name][self.delay_data_points : self.num_points]
         except VisaIOError as ex:
             raise BufferException("Could not read the buffer. Buffer has to be stopped before readout.") from ex
@@ -146,35 +173,29 @@ class SR830Buffer(Buffer):
     def subscribe(self, parameters: set | list[Parameter]) -> None:
         for parameter in parameters:
             name = parameter.name
-            if name in self.ch1_names:
-                self._device.ch1_display(name)
-                param_to_remove = {param for param in self._subscribed_parameters if param.name in self.ch1_names}
-                self._subscribed_parameters.difference_update(
-                    param_to_remove
-                )  # remove previously subscribed parameter from ch1
-                self._subscribed_parameters.add(parameter)
-            elif name in self.ch2_names:
-                self._device.ch2_display(name)
-                param_to_remove = {param for param in self._subscribed_parameters if param.name in self.ch2_names}
-                self._subscribed_parameters.difference_update(
-                    param_to_remove
-                )  # remove previously subscribed parameter from ch2
-                self._subscribed_parameters.add(parameter)
-            else:
-                raise BufferException(f"Parameter {parameter.name} can not be buffered.")
+            ch = self._get_channel(name)
+            getattr(self._device, f"{ch}_display")(name)
+            # replaces the previously subscribed parameter of this channel
+            self._ch_slots[ch] = parameter
+            self._trace_getters[ch] = getattr(self._device, f"{ch}_datatrace")
 
     def unsubscribe(self, parameters: set | list[Parameter]) -> None:
         for parameter in parameters.copy():
-            name = parameter.name
-            if name in ["X", "R", "X Noise", "aux_in1", "aux_in2"]:
-                self._subscribed_parameters.remove(parameter)
-            elif name in ["Y", "Phase", "Y Noise", "aux_in3", "aux_in4"]:
-                self._subscribed_parameters.remove(parameter)
-            else:
-                raise BufferException(f"Parameter {parameter.name} can not be buffered.")
+            ch = self._get_channel(parameter.name)
+            if self._ch_slots[ch] is not parameter:
+                raise KeyError(parameter)
+            self._ch_slots[ch] = None
 
     def is_subscribed(self, parameter: Parameter) -> bool:
-        return parameter in self._subscribed_parameters
+        return parameter in self._ch_slots.values()
+
+    def _get_channel(self, name: str) -> str:
+        """Returns the channel ("ch1" or "ch2") that can buffer the parameter with this name."""
+        if name in self._ch1_set:
+            return "ch1"
+        elif name in self._ch2_set:
+            return "ch2"
+        raise BufferException(f"Parameter {name} can not be buffered.")
 
     def start(self) -> None:
         self._device.buffer_reset()
@@ -23,13 +23,26 @@
 from __future__ import annotations
 
 import threading
-from time import sleep
+from collections.abc import Callable
+from functools import lru_cache
+from time import monotonic
 
 import numpy as np
 from qcodes.instrument import ChannelList, Instrument, InstrumentChannel
 from qcodes.validators import validators as vals
 
 
+@lru_cache(maxsize=64)
+def _ramp_setpoints(start: float, stop: float, num_points: int) -> np.ndarray:
+    """
+    Setpoints of a linear ramp. Cached, as measurement scripts usually repeat the same ramps.
+    The array is read-only, because it is shared between all ramps with the same arguments.
+    """
+    setpoints = np.linspace(start, stop, num_points)
+    setpoints.flags.writeable = False
+    return setpoints
+
+
 # %%
 class DummyDac_Channel(InstrumentChannel):
     def __init__(self, parent, name, channel):
@@ -44,10 +57,12 @@ class DummyDac_Channel(InstrumentChannel):
 
 
 class DummyDac(Instrument):
-    def __init__(self, name, trigger_event=threading.Event(), **kwargs):
+    def __init__(self, name, trigger_event: threading.Event | None = None, **kwargs):
         super().__init__(name, **kwargs)
         channels = ChannelList(self, "Instrument_Channels", DummyDac_Channel)
-        self._is_triggered = trigger_event
+        self._is_triggered = trigger_event if trigger_event is not None else threading.Event()
+        self._stop_ramp = threading.Event()
+        self.thread: threading.Thread | None = None
 
         for i in range(1, 5):
             channel = DummyDac_Channel(self, f"ch{i:02}", i)
@@ -58,93 +73,141 @@ class DummyDac(Instrument):
         self.add_submodule("channels", channels.to_channel_tuple())
         self.add_function("force_trigger", call_cmd=self._is_triggered.set)
 
+    def stop_ramp(self) -> None:
+        """Stops the currently running ramp (if any) and waits for its thread to finish."""
+        if self.thread is not None and self.thread.is_alive():
+            self._stop_ramp.set()
+            self.thread.join()
+        self._stop_ramp.clear()
+
+    def _start_ramp_thread(self, target, args, kwargs: dict | None = None) -> None:
+        """Runs target in a new ramp thread, after stopping the previous ramp."""
+        self.stop_ramp()
+        self.thread = threading.Thread(target=target, args=args, kwargs=kwargs, daemon=True)
+        self.thread.start()
+
+    def _sleep_until(self, deadline: float) -> None:
+        """
+        Sleeps until the monotonic clock reaches deadline, returns immediately if already behind
+        or if the ramp is stopped.
+        """
+        remaining = deadline - monotonic()
+        if remaining > 0:
+            self._stop_ramp.wait(remaining)
+
+    def _arm_trigger(self) -> None:
+        """
+        Discards a trigger left over from a previous ramp, so the next triggered ramp waits for a new one.
+        Done in the calling thread before the ramp thread starts, as clearing after the wait could swallow
+        the trigger for other instruments sharing the event (e.g. the DummyDmm buffer).
+        """
+        self._is_triggered.clear()
+
+    def _wait_for_trigger(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until triggered. Returns False, if the ramp was stopped before the trigger arrived
+        or no trigger arrived within timeout seconds (None waits forever).
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while not self._is_triggered.wait(timeout=0.05):
+            if self._stop_ramp.is_set():
+                return False
+            if deadline is not None and monotonic() >= deadline:
+                return False
+        return True
+
+    @staticmethod
+    def _fast_voltage_setter(channel, setpoints) -> Callable[[float], None]:
+        """
+        Validates the extremes of setpoints once and returns a setter writing directly to the voltage cache.
+        The voltage is a manual parameter without scaling or offset, so value and raw value are the same
+        and the per-step validation and conversion of cache.set can be skipped.
+        """
+        voltage = channel.voltage
+        if np.size(setpoints):
+            voltage.validate(np.min(setpoints))
+            voltage.validate(np.max(setpoints))
+        update_cache = voltage.cache._update_with
+
+        def set_voltage(value: float) -> None:
+            update_cache(value=value, raw_value=value)
+
+        return set_voltage
+
+    def _run_paced(self, setters: list[Callable[[float], None]], rows, interval: float) -> None:
+        """
+        Applies one row of setpoints (one value per setter) every interval seconds,
+        paced against the start time so the sleeps do not accumulate drift. Returns early if the ramp is stopped.
+        """
+        t_start = monotonic()
+        for k, row in enumerate(rows, 1):
+            if self._stop_ramp.is_set():
+                return
+            for set_voltage, value in zip(setters, row):
+                set_voltage(value)
+            self._sleep_until(t_start + k * interval)
+
     def _run_ramp(self, channel, start, stop, duration, num_points):
-        for setpoint in np.linspace(start, stop, int(num_points)):
-            channel.voltage(setpoint)
-            sleep(duration / num_points)
+        setpoints = _ramp_setpoints(start, stop, int(num_points))
+        self._run_paced([self._fast_voltage_setter(channel, setpoints)], zip(setpoints), duration / num_points)
 
     def ramp(self, channel, start, stop, duration, num_points):
-        self.thread = threading.Thread(
-            target=self._run_ramp,
-            args=(channel, start, stop, duration, num_points),
-            daemon=True,
-        )
-        self.thread.start()
+        self._start_ramp_thread(self._run_ramp, (channel, start, stop, duration, num_points))
 
     def ramp_channels(self, channels: list, start_values: list, stop_values: list, duration, num_points):
-        self.thread = threading.Thread(
-            target=self._run_ramp_channels,
-            args=(channels, start_values, stop_values, duration, num_points),
-            daemon=True,
-        )
-        self.thread.start()
+        self._start_ramp_thread(self._run_ramp_channels, (channels, start_values, stop_values, duration, num_points))
 
     def _run_ramp_channels(self, channels: list, start_values: list, stop_values: list, duration, num_points):
-        setpoints = []
-        for ch, start, stop in zip(channels, start_values, stop_values):
-            setpoints.append(np.linspace(start, stop, num_points))
-        setpoints_inv = []
-        for i in range(num_points):
-            setpoints_inv.append([setpoints[j][i] for j in range(len(channels))])
-        for setpoint in setpoints_inv:
-            for i in range(len(channels)):
-                channels[i].voltage(setpoint[i])
-            sleep(duration / num_points)
-
-    def _run_triggered_ramp(self, channel, start, stop, duration, stepsize=0.01):
-        _ = self._is_triggered.wait()
-        num_points = int((stop - start) / stepsize)
-        for setpoint in np.linspace(start, stop, num_points):
-            channel.voltage(setpoint)
-            sleep(duration / num_points)
-
-    def _run_triggered_ramp_channels(self, channels, start_values, stop_values, duration, num_points):
-        setpoints = []
-        for start, stop in zip(start_values, stop_values):
-            setpoints.append(np.linspace(start, stop, int(num_points)))
-        setpoints_inv = []
-        for i in range(int(num_points)):
-            setpoints_inv.append([setpoints[j][i] for j in range(len(channels))])
-        _ = self._is_triggered.wait()
-        for setpoint in setpoints_inv:
-            for i in range(len(channels)):
-                channels[i].voltage(setpoint[i])
-            sleep(duration / num_points)
-
-    def _run_triggered_pulse_channels(self, channels, setpoints, duration):
-        setpoints_inv = []
-        num_points = len(setpoints[0])
-        for i in range(int(len(setpoints[0]))):
-            setpoints_inv.append([setpoints[j][i] for j in range(len(channels))])
-        _ = self._is_triggered.wait()
-        for setpoint in setpoints_inv:
-            for i in range(len(channels)):
-                channels[i].voltage(setpoint[i])
-            sleep(duration / num_points)
-
-    def _triggered_ramp(self, channel, start, stop, duration, num_points):
-        self.thread = threading.Thread(
-            target=self._run_triggered_ramp,
-            args=(channel, start, stop, duration, num_points),
-            daemon=True,
+        setpoints = [_ramp_setpoints(start, stop, num_points) for start, stop in zip(start_values, stop_values)]
+        setters = [self._fast_voltage_setter(ch, sp) for ch, sp in zip(channels, setpoints)]
+        self._run_paced(setters, zip(*setpoints), duration / num_points)
+
+    def _run_triggered_ramp(self, channel, start, stop, duration, num_points, trigger_timeout=None):
+        if not self._wait_for_trigger(trigger_timeout):
+            return
+        setpoints = _ramp_setpoints(start, stop, int(num_points))
+        self._run_paced([self._fast_voltage_setter(channel, setpoints)], zip(setpoints), duration / num_points)
+
+    def _run_triggered_ramp_channels(
+        self, channels, start_values, stop_values, duration, num_points, trigger_timeout=None
+    ):
+        setpoints = [_ramp_setpoints(start, stop, int(num_points)) for start, stop in zip(start_values, stop_values)]
+        setters = [self._fast_voltage_setter(ch, sp) for ch, sp in zip(channels, setpoints)]
+        interval = duration / num_points
+        if not self._wait_for_trigger(trigger_timeout):
+            return
+        self._run_paced(setters, zip(*setpoints), interval)
+
+    def _run_triggered_pulse_channels(self, channels, setpoints, duration, trigger_timeout=None):
+        setters = [self._fast_voltage_setter(ch, sp) for ch, sp in zip(channels, setpoints)]
+        interval = duration / len(setpoints[0])
+        if not self._wait_for_trigger(trigger_timeout):
+            return
+        self._run_paced(setters, zip(*setpoints), interval)
+
+    def _triggered_ramp(self, channel, start, stop, duration, num_points, trigger_timeout: float | None = None):
+        self._arm_trigger()
+        self._start_ramp_thread(
+            self._run_triggered_ramp,
+            (channel, start, stop, duration, num_points),
+            {"trigger_timeout": trigger_timeout},
         )
-        self.thread.start()
 
-    def _triggered_ramp_channels(self, channels, start_values, stop_values, duration, num_points):
-        self.thread = threading.Thread(
-            target=self._run_triggered_ramp_channels,
-            args=(channels, start_values, stop_values, duration, num_points),
-            daemon=True,
+    def _triggered_ramp_channels(
+        self, channels, start_values, stop_values, duration, num_points, trigger_timeout: float | None = None
+    ):
+        self._arm_trigger()
+        self._start_ramp_thread(
+            self._run_triggered_ramp_channels,
+            (channels, start_values, stop_values, duration, num_points),
+            {"trigger_timeout": trigger_timeout},
         )
-        self.thread.start()
 
-    def _triggered_pulse_channels(self, channels, setpoints, duration):
-        self.thread = threading.Thread(
-            target=self._run_triggered_pulse_channels,
-            args=(channels, setpoints, duration),
-            daemon=True,
+    def _triggered_pulse_channels(self, channels, setpoints, duration, trigger_timeout: float | None = None):
+        self._arm_trigger()
+        self._start_ramp_thread(
+            self._run_triggered_pulse_channels, (channels, setpoints, duration), {"trigger_timeout": trigger_timeout}
         )
-        self.thread.start()
 
 
 # %%
@@ -17,11 +17,9 @@
 # Contributors:
 # - Daniel Grothe
 
-import inspect
-
 from qcodes.instrument import Instrument
 
 
 def is_instrument_class(o):
     """True, if class is of type Instrument or a subclass of Instrument"""
-    return inspect.isclass(o) and issubclass(o, Instrument)
+    return isinstance(o, type) and issubclass(o, Instrument)
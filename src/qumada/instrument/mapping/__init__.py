@@ -21,6 +21,7 @@
 # - Sionludi Lab
 # - Till Huckeman
 
+import os
 
 from .base import (
     MappingError,
@@ -28,7 +29,15 @@ from .base import (
     filter_flatten_parameters,
     map_gates_to_instruments,
 )
-from .mapping_gui import map_terminals_gui
+
+
+def __getattr__(name: str):
+    """Import the mapping GUI (and with it PyQt5) only when it is actually requested."""
+    if name == "map_terminals_gui":
+        from .mapping_gui import map_terminals_gui
+
+        return map_terminals_gui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _build_path(subpath: str) -> str:
@@ -41,7 +50,7 @@ def _build_path(subpath: str) -> str:
     Returns:
         str: Path to the JSON file.
     """
-    return __file__.replace("__init__.py", subpath)
+    return os.path.join(os.path.dirname(__file__), subpath)
 
 
 DECADAC_MAPPING = _build_path("Harvard/Decadac.json")
@@ -21,6 +21,7 @@
 from __future__ import annotations
 
 import json
+import os
 from collections.abc import Iterable, Mapping
 from typing import Any
 
@@ -60,6 +61,8 @@ from qcodes.utils.metadata import Metadatable
 from qumada.instrument.mapping.base import TerminalParameters, filter_flatten_parameters
 from qumada.metadata import Metadata
 
+GUI_HELP_TXT_PATH = os.path.join(os.path.dirname(__file__), "GUI_help.txt")
+
 RED = QColor(255, 0, 0)
 WHITE = QColor(255, 255, 255)
 GREEN = QColor(0, 255, 0)
@@ -642,8 +645,7 @@ class MainWindow(QMainWindow):
         return super().closeEvent(ev)
 
     def show_help(self):
-        gui_help_txt_path = __file__.replace("mapping_gui.py", "GUI_help.txt")
-        with open(gui_help_txt_path) as f:
+        with open(GUI_HELP_TXT_PATH) as f:
             help_txt = f.read()
 
         self.help_window = ScrollLabel(help_txt)
@@ -409,9 +409,9 @@ def _interpret_breaks(break_conditions: list, **kwargs) -> Callable[[], bool] |
 
     Parameters
     ----------
-    break_conditions : List of dictionaries containing:
-            "channel": Gettable parameter to check
-            "break_condition": String specifying the break condition.
+    break_conditions : List of BreakCondition tuples containing:
+            channel: Gettable parameter to check
+            break_condition: String specifying the break condition.
                     Syntax:
                         Parameter to check: only "val" supported so far.
                         Comparator: "<",">" or "=="
@@ -441,7 +441,7 @@ def _interpret_breaks(break_conditions: list, **kwargs) -> Callable[[], bool] |
         return ops[oper](op1, op2)
 
     def f(cond, ops):
-        return partial(eval_binary_expr, cond["channel"].get_latest(), ops[1], float(ops[2]))()
+        return partial(eval_binary_expr, cond.channel.get_latest(), ops[1], float(ops[2]))()
 
     def check_conditions(conditions: list[Callable[[], bool]]):
         for cond in conditions:
@@ -453,7 +453,7 @@ def _interpret_breaks(break_conditions: list, **kwargs) -> Callable[[], bool] |
 
     # Create break condition callables
     for cond in break_conditions:
-        ops = cond["break_condition"].split(" ")
+        ops = cond.break_condition.split(" ")
         if ops[0] != "val":
             raise NotImplementedError(
                 'Only parameter values can be used for breaks in this version. Use "val" for the break condition.'
@@ -469,9 +469,9 @@ def _dev_interpret_breaks(break_conditions: list, sweep_values: dict, **kwargs)
 
     Parameters
     ----------
-    break_conditions : List of dictionaries containing:
-            "channel": Gettable parameter to check
-            "break_condition": String specifying the break condition.
+    break_conditions : List of BreakCondition tuples containing:
+            channel: Gettable parameter to check
+            break_condition: String specifying the break condition.
                     Syntax:
                         Parameter to check: only "val" supported so far.
                         Comparator: "<",">" or "=="
@@ -512,8 +512,8 @@ def _dev_interpret_breaks(break_conditions: list, sweep_values: dict, **kwargs)
     conditions = []
     # Create break condition callables
     for cond in break_conditions:
-        ops = cond["break_condition"].split(" ")
-        data = sweep_values[cond["channel"]]
+        ops = cond.break_condition.split(" ")
+        data = sweep_values[cond.channel]
         if ops[0] == "val":
 
             def f():
@@ -26,12 +26,13 @@ import copy
 import inspect
 import json
 import logging
+import math
 from abc import ABC, abstractmethod
 from collections.abc import MutableSequence
 from contextlib import suppress
 from datetime import datetime
-from functools import wraps
-from typing import Any, Callable
+from functools import lru_cache, partial, wraps
+from typing import Any, Callable, NamedTuple
 
 import numpy as np
 import qcodes as qc
@@ -49,31 +50,78 @@ logger = logging.getLogger(__name__)
 
 
 def is_measurement_script(o):
-    return inspect.isclass(o) and issubclass(o, MeasurementScript)
+    return isinstance(o, type) and issubclass(o, MeasurementScript)
 
 
 class QtoolsStation(Station):
     """Station object, inherits from qcodes Station."""
 
 
+class BreakCondition(NamedTuple):
+    """Break condition of a gettable parameter, e.g. BreakCondition(channel, "val > 1.5")."""
+
+    channel: Parameter
+    break_condition: str
+
+
+class _ParameterTypeFlags(NamedTuple):
+    """Parsed "type" property of a gate parameter, e.g. "static gettable"."""
+
+    is_static: bool
+    is_gettable: bool
+    is_dynamic: bool
+    is_compensating: bool
+
+    @classmethod
+    def from_type(cls, type_: str) -> _ParameterTypeFlags:
+        return cls("static" in type_, "gettable" in type_, "dynamic" in type_, "comp" in type_)
+
+
+@lru_cache(maxsize=None)
+def _get_class_source(cls: type) -> str:
+    """Cached inspect.getsource, which reads and tokenizes the whole module file on every call."""
+    return inspect.getsource(cls)
+
+
+def _get_ramp_target(properties: dict, use_value: bool = True) -> Any:
+    """
+    Value a dynamic parameter is ramped to before its sweep: Its "value" (if use_value is True),
+    otherwise its "start" or its first setpoint, depending on what is defined.
+    """
+    if use_value and "value" in properties:
+        return properties["value"]
+    if "start" in properties:
+        return properties["start"]
+    return properties["setpoints"][0]
+
+
+def _flatten_buffer_data(data) -> np.ndarray | list:
+    """
+    Flattens data read from a buffer. Numeric numpy arrays are reshaped, which does not copy contiguous data,
+    everything else (e.g. nested lists) is flattened with flatten_array.
+    """
+    if isinstance(data, np.ndarray) and data.dtype != object:
+        return data.reshape(-1)
+    return flatten_array(data)
+
+
 def create_hook(func, hook):
     """
     Decorator to hook a function onto an existing function.
     The hook function can use keyword-only arguments, which are omitted prior to execution of the main function.
     """
+    # The hook is fixed, so its named keyword arguments are determined once instead of on every call.
+    hook_kwargs = frozenset(
+        name
+        for name, p in inspect.signature(hook).parameters.items()
+        if p.kind in (inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    )
 
     @wraps(func)
     def wrapper(*args, **kwargs):
         hook(*args, **kwargs)
         # remove arguments used in hook from kwargs
-        sig = inspect.signature(hook)
-        varkw = next(
-            filter(
-                lambda p: p.kind is inspect.Parameter.VAR_KEYWORD,
-                sig.parameters.values(),
-            )
-        ).name
-        unused_kwargs = sig.bind(*args, **kwargs).arguments.get(varkw) or {}
+        unused_kwargs = {k: v for k, v in kwargs.items() if k not in hook_kwargs}
         return func(*args, **unused_kwargs)
 
     return wrapper
@@ -111,14 +159,13 @@ class MeasurementScript(ABC):
     }
 
     def __init__(self):
-        # Create function hooks for metadata
-        # reverse order, so insert metadata is run second
-        self.run = create_hook(self.run, self._insert_metadata_into_db)
-        self.run = create_hook(self.run, self._add_data_to_metadata)
-        self.run = create_hook(self.run, self._add_current_datetime_to_metadata)
+        # Create function hook for metadata
+        self.run = create_hook(self.run, self._finalize_metadata)
 
         self.properties: dict[Any, Any] = {}
         self.gate_parameters: dict[Any, dict[Any, Parameter | None] | Parameter | None] = {}
+        self.buffer_settings: dict = {}
+        self.settings: dict = {}
         self._buffered_num_points: int | None = None
 
     def add_gate_parameter(self, parameter_name: str, gate_name: str = None, parameter: Parameter = None) -> None:
@@ -150,27 +197,28 @@ class MeasurementScript(ABC):
         the buffered_num_points accordingly. Required to define QCoDeS datastructure.
         """
 
-        if "burst_duration" in self.buffer_settings:
-            self._burst_duration = float(self.buffer_settings["burst_duration"])
+        buffer_settings = self.buffer_settings
+        if "burst_duration" in buffer_settings:
+            self._burst_duration = float(buffer_settings["burst_duration"])
 
-        if "duration" in self.buffer_settings:
-            if "burst_duration" in self.buffer_settings:
-                self._num_bursts = np.ceil(float(self.buffer_settings["duration"]) / self._burst_duration)
-            elif "num_bursts" in self.buffer_settings:
-                self._num_bursts = int(self.buffer_settings["num_bursts"])
-                self._burst_duration = float(self.buffer_settings["duration"]) / self._num_bursts
+        if "duration" in buffer_settings:
+            if "burst_duration" in buffer_settings:
+                self._num_bursts = math.ceil(float(buffer_settings["duration"]) / self._burst_duration)
+            elif "num_bursts" in buffer_settings:
+                self._num_bursts = int(buffer_settings["num_bursts"])
+                self._burst_duration = float(buffer_settings["duration"]) / self._num_bursts
 
-        if "num_points" in self.buffer_settings:
-            self.buffered_num_points = int(self.buffer_settings["num_points"])
-            if "sampling_rate" in self.buffer_settings:
-                self._burst_duration = float(self.buffered_num_points / self.buffer_settings["sampling_rate"])
+        if "num_points" in buffer_settings:
+            self.buffered_num_points = int(buffer_settings["num_points"])
+            if "sampling_rate" in buffer_settings:
+                self._burst_duration = float(self.buffered_num_points / buffer_settings["sampling_rate"])
 
-        elif "sampling_rate" in self.buffer_settings:
-            self._sampling_rate = float(self.buffer_settings["sampling_rate"])
+        elif "sampling_rate" in buffer_settings:
+            self._sampling_rate = float(buffer_settings["sampling_rate"])
             if self._burst_duration is not None:
-                self.buffered_num_points = np.ceil(self._sampling_rate * self._burst_duration)
-            elif all(k in self.buffer_settings for k in ("duration", "num_bursts")):
-                self._burst_duration = float(self.buffer_settings["duration"] / self.buffer_settings["num_bursts"])
+                self.buffered_num_points = math.ceil(self._sampling_rate * self._burst_duration)
+            elif "duration" in buffer_settings and "num_bursts" in buffer_settings:
+                self._burst_duration = float(buffer_settings["duration"] / buffer_settings["num_bursts"])
 
     def setup(
         self,
@@ -208,21 +256,14 @@ class MeasurementScript(ABC):
         self._lists_created = False
         self.measurement_name = measurement_name
         cls = type(self)
-        try:
-            self.buffer_settings.update(buffer_settings)
-        except Exception:
-            self.buffer_settings = buffer_settings
+        self.buffer_settings.update(buffer_settings)
         self._set_buffered_num_points()
-
-        try:
-            self.settings.update(settings)
-        except Exception:
-            self.settings = settings
+        self.settings.update(settings)
 
         # Add script and parameters to metadata
         if add_script_to_metadata:
             try:
-                metadata.add_script_to_metadata(inspect.getsource(cls), language="python", name=cls.__name__)
+                metadata.add_script_to_metadata(_get_class_source(cls), language="python", name=cls.__name__)
             except OSError as err:
                 print(f"Source of MeasurementScript could not be acquired: {err}")
             except Exception as ex:
@@ -234,11 +275,23 @@ class MeasurementScript(ABC):
             except Exception as ex:
                 print(f"Parameters could not be added to metadata: {ex}")
 
-        # Add gate parameters
+        # Add gate parameters. Names are validated in one go, instead of once per parameter in add_gate_parameter.
+        unknown_names = {parameter for vals in parameters.values() for parameter in vals} - self.PARAMETER_NAMES
+        if unknown_names:
+            raise NameError(f"parameter_names {sorted(unknown_names)} not in MeasurementScript.PARAMETER_NAMES.")
         for gate, vals in parameters.items():
             self.properties[gate] = vals
-            for parameter, properties in vals.items():
-                self.add_gate_parameter(parameter, gate)
+            gate_parameters = self.gate_parameters.setdefault(gate, {})
+            if not isinstance(gate_parameters, dict):
+                raise Exception(f"Gate {gate} is not a dictionary.")
+            for parameter in vals:
+                gate_parameters[parameter] = None
+        # Parse the parameter types once instead of in every loop of generate_lists, initialize and reset
+        self._parameter_flags = {
+            (gate, parameter): _ParameterTypeFlags.from_type(properties["type"])
+            for gate, vals in self.properties.items()
+            for parameter, properties in vals.items()
+        }
 
     def generate_lists(self) -> None:
         """
@@ -265,7 +318,7 @@ class MeasurementScript(ABC):
         self.gettable_channels: list[str] = []
         self.static_gettable_parameters: list[str] = []
         self.static_gettable_channels: list[str] = []
-        self.break_conditions: list[str] = []
+        self.break_conditions: list[BreakCondition] = []
         self.static_parameters: list[str] = []
         self.static_channels: list[str] = []
         self.dynamic_parameters: list[str] = []
@@ -285,161 +338,153 @@ class MeasurementScript(ABC):
         self.priorities: dict = {}
         self.loop: int = 0  # For usage with looped measurements
 
-        for gate, parameters in self.gate_parameters.items():
-            for parameter, channel in parameters.items():
-                if gate == "abstract":
-                    self.abstract_parameters.append()
-                    self.abstract_setpoints.append(self.properties[gate][parameter]["setpoints"])
-
-                if self.properties[gate][parameter]["type"].find("static") >= 0:
-                    self.static_parameters.append({"gate": gate, "parameter": parameter})
-                    self.static_channels.append(channel)
-                    if self.properties[gate][parameter]["type"].find("gettable") >= 0:
-                        self.static_gettable_parameters.append({"gate": gate, "parameter": parameter})
-                        self.static_gettable_channels.append(channel)
-                if self.properties[gate][parameter]["type"].find("gettable") >= 0:
-                    self.gettable_parameters.append({"gate": gate, "parameter": parameter})
-                    self.gettable_channels.append(channel)
-                    with suppress(KeyError):
-                        if self.properties[gate][parameter]["break_conditions"] is not None:
-                            for condition in self.properties[gate][parameter]["break_conditions"]:
-                                self.break_conditions.append({"channel": channel, "break_condition": condition})
-                if self.properties[gate][parameter]["type"].find("comp") >= 0:
-                    self.compensating_parameters.append({"gate": gate, "parameter": parameter})
-                    self.compensating_channels.append(channel)
-                    try:
-                        self.compensating_parameters_values.append(self.properties[gate][parameter]["value"])
-                    except KeyError as e:
-                        print(
-                            f"No value assigned for compensating parameter \
-                              {self.compensating_parameters[-1]}"
-                        )
-                        raise e
-                    try:
-                        leverarms = self.properties[gate][parameter]["leverarms"]
-                        assert isinstance(leverarms, list)
-                        self.compensating_leverarms.append(self.properties[gate][parameter]["leverarms"])
-                    except KeyError as e:
-                        print(f"No leverarm specified for parameters {self.compensating_parameters[-1]}!")
-                        raise e
-                    try:
-                        comp_list = []
-                        for entry in self.properties[gate][parameter]["compensated_gates"]:
-                            assert isinstance(entry, dict)
-                            comp_list.append({"gate": entry["terminal"], "parameter": entry["parameter"]})
-                        self.compensated_parameters.append(comp_list)
-                    except KeyError as e:
-                        print(
-                            f"The terminal to be compensated for with {self.compensating_parameters[-1]} \
-                            is not properly specified! Make sure to define a dictionary with \
-                            terminal and parameter as keys."
-                        )
-                        raise e
-                    try:
-                        limits = self.properties[gate][parameter]["limits"]
-                        self.compensating_limits.append(limits)
-                    except KeyError as e:
-                        print(
-                            f"No limits assigned to compensating parameter \
-                              {self.compensating_parameters[-1]}!"
-                        )
-                        raise e
-
-                elif self.properties[gate][parameter]["type"].find("dynamic") >= 0:
-                    self.dynamic_parameters.append({"gate": gate, "parameter": parameter})
-                    self.dynamic_channels.append(channel)
-                    if self.properties[gate][parameter].get("_is_triggered", False) and self.buffered:
-                        if "num_points" in self.properties[gate][parameter].keys():
-                            try:
-                                assert self.properties[gate][parameter]["num_points"] == self.buffered_num_points
-                            except AssertionError:
-                                logger.warning(
-                                    f"Number of datapoints from buffer_settings\
-                                    and gate_parameters do not match. Using \
-                                    the value from the buffer settings: \
-                                    {self.buffered_num_points}"
-                                )
-                        elif "setpoints" in self.properties[gate][parameter].keys():
-                            try:
-                                assert len(self.properties[gate][parameter]["setpoints"]) == self.buffered_num_points
-                            except AssertionError:
-                                logger.warning(
-                                    f"Number of datapoints from buffer_settings\
-                                    and gate_parameters do not match. Using \
-                                    the value from the buffer settings: \
-                                    {self.buffered_num_points}"
-                                )
+        self._flatten_parameters()
+        for gate, parameter, channel, props, flags in self._flat_params:
+            if gate == "abstract":
+                self.abstract_parameters.append()
+                self.abstract_setpoints.append(props["setpoints"])
+
+            if flags.is_static:
+                self.static_parameters.append({"gate": gate, "parameter": parameter})
+                self.static_channels.append(channel)
+                if flags.is_gettable:
+                    self.static_gettable_parameters.append({"gate": gate, "parameter": parameter})
+                    self.static_gettable_channels.append(channel)
+            if flags.is_gettable:
+                self.gettable_parameters.append({"gate": gate, "parameter": parameter})
+                self.gettable_channels.append(channel)
+                with suppress(KeyError):
+                    if props["break_conditions"] is not None:
+                        for condition in props["break_conditions"]:
+                            self.break_conditions.append(BreakCondition(channel, condition))
+            if flags.is_compensating:
+                self.compensating_parameters.append({"gate": gate, "parameter": parameter})
+                self.compensating_channels.append(channel)
+                try:
+                    self.compensating_parameters_values.append(props["value"])
+                except KeyError as e:
+                    print(
+                        f"No value assigned for compensating parameter \
+                          {self.compensating_parameters[-1]}"
+                    )
+                    raise e
+                try:
+                    leverarms = props["leverarms"]
+                    assert isinstance(leverarms, list)
+                    self.compensating_leverarms.append(props["leverarms"])
+                except KeyError as e:
+                    print(f"No leverarm specified for parameters {self.compensating_parameters[-1]}!")
+                    raise e
+                try:
+                    comp_list = []
+                    for entry in props["compensated_gates"]:
+                        assert isinstance(entry, dict)
+                        comp_list.append({"gate": entry["terminal"], "parameter": entry["parameter"]})
+                    self.compensated_parameters.append(comp_list)
+                except KeyError as e:
+                    print(
+                        f"The terminal to be compensated for with {self.compensating_parameters[-1]} \
+                        is not properly specified! Make sure to define a dictionary with \
+                        terminal and parameter as keys."
+                    )
+                    raise e
+                try:
+                    limits = props["limits"]
+                    self.compensating_limits.append(limits)
+                except KeyError as e:
+                    print(
+                        f"No limits assigned to compensating parameter \
+                          {self.compensating_parameters[-1]}!"
+                    )
+                    raise e
 
-                        else:
-                            logger.info(
-                                "No num_points or setpoints given for\
-                                         buffered measurement. The value from \
-                                         buffer_settings is used"
-                            )
+            elif flags.is_dynamic:
+                self.dynamic_parameters.append({"gate": gate, "parameter": parameter})
+                self.dynamic_channels.append(channel)
+                if props.get("_is_triggered", False) and self.buffered:
+                    if "num_points" in props.keys():
                         try:
-                            self.dynamic_sweeps.append(
-                                LinSweep(
-                                    channel,
-                                    self.properties[gate][parameter]["start"],
-                                    self.properties[gate][parameter]["stop"],
-                                    int(self.buffered_num_points),
-                                    delay=self.properties[gate][parameter].setdefault("delay", 0),
-                                )
-                            )
-                        except KeyError:
-                            self.dynamic_sweeps.append(
-                                LinSweep(
-                                    channel,
-                                    self.properties[gate][parameter]["setpoints"][0],
-                                    self.properties[gate][parameter]["setpoints"][-1],
-                                    int(self.buffered_num_points),
-                                    delay=self.properties[gate][parameter].setdefault("delay", 0),
-                                )
+                            assert props["num_points"] == self.buffered_num_points
+                        except AssertionError:
+                            logger.warning(
+                                f"Number of datapoints from buffer_settings\
+                                and gate_parameters do not match. Using \
+                                the value from the buffer settings: \
+                                {self.buffered_num_points}"
                             )
-                    else:
+                    elif "setpoints" in props.keys():
                         try:
-                            self.dynamic_sweeps.append(
-                                LinSweep(
-                                    channel,
-                                    self.properties[gate][parameter]["start"],
-                                    self.properties[gate][parameter]["stop"],
-                                    int(self.properties[gate][parameter]["num_points"]),
-                                    delay=self.properties[gate][parameter].setdefault("delay", 0),
-                                )
-                            )
-                        except KeyError:
-                            self.dynamic_sweeps.append(
-                                CustomSweep(
-                                    channel,
-                                    self.properties[gate][parameter]["setpoints"],
-                                    delay=self.properties[gate][parameter].setdefault("delay", 0),
-                                )
+                            assert len(props["setpoints"]) == self.buffered_num_points
+                        except AssertionError:
+                            logger.warning(
+                                f"Number of datapoints from buffer_settings\
+                                and gate_parameters do not match. Using \
+                                the value from the buffer settings: \
+                                {self.buffered_num_points}"
                             )
 
-                    # Only executed for dynamic parameters!
-                    if "group" in self.properties[gate][parameter].keys():
-                        group = self.properties[gate][parameter]["group"]
-                        if group not in self.groups.keys():
-                            self.groups[group] = {"channels": [], "parameters": [], "priority": None}
-                        self.groups[group]["channels"].append(channel)
-                        self.groups[group]["parameters"].append({"gate": gate, "parameter": parameter})
-                        if self.groups[group]["priority"] is None:
-                            if "priority" in self.properties[gate][parameter].keys():
-                                if self.groups[group]["priority"] in self.priorities.keys():
-                                    raise Exception("Assigned the same priority to multiple groups")
-                                elif self.groups[group]["priority"] is None:
-                                    self.groups[group]["priority"] = int(self.properties[gate][parameter]["priority"])
-                                    self.priorities[int(self.groups[group]["priority"])] = self.groups[group]
-                                    self.dynamic_parameters[-1]["priority"] = int(self.groups[group]["priority"])
-                            else:
-                                try:
-                                    prio = int(group)
-                                    if prio not in self.priorities.keys():
-                                        self.groups[group]["priority"] = prio
-                                        self.priorities[prio] = self.groups[group]
-                                        self.dynamic_parameters[-1]["priority"] = prio
-                                except Exception:
-                                    pass
+                    else:
+                        logger.info(
+                            "No num_points or setpoints given for\
+                                     buffered measurement. The value from \
+                                     buffer_settings is used"
+                        )
+                    if "start" in props and "stop" in props:
+                        start, stop = props["start"], props["stop"]
+                    else:
+                        start, stop = props["setpoints"][0], props["setpoints"][-1]
+                    self.dynamic_sweeps.append(
+                        LinSweep(
+                            channel,
+                            start,
+                            stop,
+                            int(self.buffered_num_points),
+                            delay=props.setdefault("delay", 0),
+                        )
+                    )
+                elif "start" in props and "stop" in props and "num_points" in props:
+                    self.dynamic_sweeps.append(
+                        LinSweep(
+                            channel,
+                            props["start"],
+                            props["stop"],
+                            int(props["num_points"]),
+                            delay=props.setdefault("delay", 0),
+                        )
+                    )
+                else:
+                    self.dynamic_sweeps.append(
+                        CustomSweep(
+                            channel,
+                            props["setpoints"],
+                            delay=props.setdefault("delay", 0),
+                        )
+                    )
+
+                # Only executed for dynamic parameters!
+                if "group" in props.keys():
+                    group = props["group"]
+                    if group not in self.groups.keys():
+                        self.groups[group] = {"channels": [], "parameters": [], "priority": None}
+                    self.groups[group]["channels"].append(channel)
+                    self.groups[group]["parameters"].append({"gate": gate, "parameter": parameter})
+                    if self.groups[group]["priority"] is None:
+                        if "priority" in props.keys():
+                            if self.groups[group]["priority"] in self.priorities.keys():
+                                raise Exception("Assigned the same priority to multiple groups")
+                            elif self.groups[group]["priority"] is None:
+                                self.groups[group]["priority"] = int(props["priority"])
+                                self.priorities[int(self.groups[group]["priority"])] = self.groups[group]
+                                self.dynamic_parameters[-1]["priority"] = int(self.groups[group]["priority"])
+                        else:
+                            try:
+                                prio = int(group)
+                                if prio not in self.priorities.keys():
+                                    self.groups[group]["priority"] = prio
+                                    self.priorities[prio] = self.groups[group]
+                                    self.dynamic_parameters[-1]["priority"] = prio
+                            except Exception:
+                                pass
 
         if self.buffered:
             self.buffers = {
@@ -452,6 +497,18 @@ class MeasurementScript(ABC):
         self._lists_created = True
         self._relabel_instruments()
 
+    def _flatten_parameters(self) -> None:
+        """
+        Collects (gate, parameter, channel, properties, flags) of all gate parameters in one flat list,
+        so the loops over all parameters do not have to walk and index the nested dicts.
+        Has to be done after mapping!
+        """
+        self._flat_params = [
+            (gate, parameter, channel, self.properties[gate][parameter], self._parameter_flags[gate, parameter])
+            for gate, parameters in self.gate_parameters.items()
+            for parameter, channel in parameters.items()
+        ]
+
     def sort_by_priority(self):
         combined_lists = list(zip(self.dynamic_parameters, self.dynamic_channels, self.dynamic_sweeps))
         combined_sorted = sorted(combined_lists, key=lambda x: (x[0].get("priority", float("inf"))))
@@ -485,6 +542,9 @@ class MeasurementScript(ABC):
         ramp_rate = self.settings.get("ramp_rate", 0.3)
         ramp_time = self.settings.get("ramp_time", 5)
         setpoint_intervall = self.settings.get("setpoint_intervall", 0.1)
+        ramp = partial(
+            ramp_or_set_parameter, ramp_rate=ramp_rate, ramp_time=ramp_time, setpoint_intervall=setpoint_intervall
+        )
         if not self._lists_created:
             self.generate_lists()
         # for item in self.compensated_parameters:
@@ -492,229 +552,175 @@ class MeasurementScript(ABC):
         #         raise Exception(f"{item} is not in dynamic parameters and cannot be compensated!")
         # self.dynamic_sweeps = []
         self.compensating_sweeps = []
-        for gate, parameters in self.gate_parameters.items():
-            for parameter, channel in parameters.items():
-                if self.properties[gate][parameter]["type"].find("static") >= 0:
-                    ramp_or_set_parameter(
-                        channel,
-                        self.properties[gate][parameter]["value"],
-                        ramp_rate=ramp_rate,
-                        ramp_time=ramp_time,
-                        setpoint_intervall=setpoint_intervall,
-                    )
-                elif self.properties[gate][parameter]["type"].find("dynamic") >= 0:
-                    if self.properties[gate][parameter].get("_is_triggered", False) and self.buffered:
-                        if "num_points" in self.properties[gate][parameter].keys():
-                            try:
-                                assert self.properties[gate][parameter]["num_points"] == self.buffered_num_points
-                            except AssertionError:
-                                logger.warning(
-                                    f"Number of datapoints from buffer_settings\
-                                    and gate_parameters do not match. Using \
-                                    the value from the buffer settings: \
-                                    {self.buffered_num_points}"
-                                )
-                                self.properties[gate][parameter]["num_points"] = self.buffered_num_points
-
-                        elif "setpoints" in self.properties[gate][parameter].keys():
-                            try:
-                                assert len(self.properties[gate][parameter]["setpoints"]) == self.buffered_num_points
-                            except AssertionError:
-                                logger.warning(
-                                    f"Number of datapoints from buffer_settings\
-                                    and gate_parameters do not match. Using \
-                                    the value from the buffer settings: \
-                                    {self.buffered_num_points}"
-                                )
-
-                        else:
-                            logger.info(
-                                "No num_points or setpoints given for\
-                                         buffered measurement. The value from \
-                                         buffer_settings is used"
-                            )
-                    #     try:
-                    #         self.dynamic_sweeps.append(
-                    #             LinSweep(
-                    #                 channel,
-                    #                 self.properties[gate][parameter]["start"],
-                    #                 self.properties[gate][parameter]["stop"],
-                    #                 int(self.buffered_num_points),
-                    #                 delay=self.properties[gate][parameter].setdefault("delay", 0),
-                    #             )
-                    #         )
-                    #     except KeyError:
-                    #         self.dynamic_sweeps.append(
-                    #             CustomSweep(
-                    #                 channel,
-                    #                 self.properties[gate][parameter]["setpoints"],
-                    #                 delay=self.properties[gate][parameter].setdefault("delay", 0),
-                    #             )
-                    #         )
-                    # else:
-                    #     try:
-                    #         self.dynamic_sweeps.append(
-                    #             LinSweep(
-                    #                 channel,
-                    #                 self.properties[gate][parameter]["start"],
-                    #                 self.properties[gate][parameter]["stop"],
-                    #                 int(self.properties[gate][parameter]["num_points"]),
-                    #                 delay=self.properties[gate][parameter].setdefault("delay", 0),
-                    #             )
-                    #         )
-                    #     except KeyError:
-                    #         self.dynamic_sweeps.append(
-                    #             CustomSweep(
-                    #                 channel,
-                    #                 self.properties[gate][parameter]["setpoints"],
-                    #                 delay=self.properties[gate][parameter].setdefault("delay", 0),
-                    #             )
-                    #         )
-
-                    # Handle different possibilities for starting points
-                    if dyn_ramp_to_val or channel in inactive_dyn_channels:
+        for gate, parameter, channel, props, flags in self._flat_params:
+            if flags.is_static:
+                ramp(channel, props["value"])
+            elif flags.is_dynamic:
+                if props.get("_is_triggered", False) and self.buffered:
+                    if "num_points" in props.keys():
                         try:
-                            ramp_or_set_parameter(
-                                channel,
-                                self.properties[gate][parameter]["value"],
-                                ramp_rate=ramp_rate,
-                                ramp_time=ramp_time,
-                                setpoint_intervall=setpoint_intervall,
+                            assert props["num_points"] == self.buffered_num_points
+                        except AssertionError:
+                            logger.warning(
+                                f"Number of datapoints from buffer_settings\
+                                and gate_parameters do not match. Using \
+                                the value from the buffer settings: \
+                                {self.buffered_num_points}"
                             )
-                        except KeyError:
-                            try:
-                                ramp_or_set_parameter(
-                                    channel,
-                                    self.properties[gate][parameter]["start"],
-                                    ramp_rate=ramp_rate,
-                                    ramp_time=ramp_time,
-                                    setpoint_intervall=setpoint_intervall,
-                                )
-                            except KeyError:
-                                ramp_or_set_parameter(
-                                    channel,
-                                    self.properties[gate][parameter]["setpoints"][0],
-                                    ramp_rate=ramp_rate,
-                                    ramp_time=ramp_time,
-                                    setpoint_intervall=setpoint_intervall,
-                                )
-                    else:
+                            props["num_points"] = self.buffered_num_points
+
+                    elif "setpoints" in props.keys():
                         try:
-                            ramp_or_set_parameter(
-                                channel,
-                                self.properties[gate][parameter]["start"],
-                                ramp_rate=ramp_rate,
-                                ramp_time=ramp_time,
-                                setpoint_intervall=setpoint_intervall,
-                            )
-                        except KeyError:
-                            ramp_or_set_parameter(
-                                channel,
-                                self.properties[gate][parameter]["setpoints"][0],
-                                ramp_rate=ramp_rate,
-                                ramp_time=ramp_time,
-                                setpoint_intervall=setpoint_intervall,
+                            assert len(props["setpoints"]) == self.buffered_num_points
+                        except AssertionError:
+                            logger.warning(
+                                f"Number of datapoints from buffer_settings\
+                                and gate_parameters do not match. Using \
+                                the value from the buffer settings: \
+                                {self.buffered_num_points}"
                             )
 
-                    # Generate sweeps from parameters
+                    else:
+                        logger.info(
+                            "No num_points or setpoints given for\
+                                     buffered measurement. The value from \
+                                     buffer_settings is used"
+                        )
+                #     try:
+                #         self.dynamic_sweeps.append(
+                #             LinSweep(
+                #                 channel,
+                #                 self.properties[gate][parameter]["start"],
+                #                 self.properties[gate][parameter]["stop"],
+                #                 int(self.buffered_num_points),
+                #                 delay=self.properties[gate][parameter].setdefault("delay", 0),
+                #             )
+                #         )
+                #     except KeyError:
+                #         self.dynamic_sweeps.append(
+                #             CustomSweep(
+                #                 channel,
+                #                 self.properties[gate][parameter]["setpoints"],
+                #                 delay=self.properties[gate][parameter].setdefault("delay", 0),
+                #             )
+                #         )
+                # else:
+                #     try:
+                #         self.dynamic_sweeps.append(
+                #             LinSweep(
+                #                 channel,
+                #                 self.properties[gate][parameter]["start"],
+                #                 self.properties[gate][parameter]["stop"],
+                #                 int(self.properties[gate][parameter]["num_points"]),
+                #                 delay=self.properties[gate][parameter].setdefault("delay", 0),
+                #             )
+                #         )
+                #     except KeyError:
+                #         self.dynamic_sweeps.append(
+                #             CustomSweep(
+                #                 channel,
+                #                 self.properties[gate][parameter]["setpoints"],
+                #                 delay=self.properties[gate][parameter].setdefault("delay", 0),
+                #             )
+                #         )
+
+                # Handle different possibilities for starting points
+                ramp(channel, _get_ramp_target(props, use_value=dyn_ramp_to_val or channel in inactive_dyn_channels))
+
+                # Generate sweeps from parameters
         self.active_compensated_channels = []
         self.active_compensating_channels = []
         self.active_compensating_parameters = []
         inactive_dyn_params = []
         for ch in inactive_dyn_channels:
             inactive_dyn_params.append(self.dynamic_parameters[self.dynamic_channels.index(ch)])
-        for gate, parameters in self.gate_parameters.items():
-            for parameter, channel in parameters.items():
-                # This iterates over all compensating parameters
-                if self.properties[gate][parameter]["type"].find("comp") >= 0:
-                    try:
-                        i = self.compensating_parameters.index({"gate": gate, "parameter": parameter})
-                        leverarms = self.compensating_leverarms[i]
-                        comped_params = copy.deepcopy(
-                            self.compensated_parameters[i]
-                        )  # list of parameters compensated by the current parameter
-                        comped_sweeps = []  # Sweeps that are compensated by current param
-                        comped_leverarms = []  # Leverarms of the current param
-                        comping_sweeps = []  # List to store only the sweeps for the current param
-                        k = 0
-                        for comped_param in comped_params.copy():
-                            # Check if the parameter is actually ramped in this part of the measurement
-                            if comped_param in inactive_dyn_params:
-                                comped_params.remove(comped_param)
-                            else:
-                                # Get only the relevant list entries for the current parameter
-                                try:
-                                    comped_index = self.dynamic_parameters.index(comped_param)
-                                except ValueError as e:
-                                    logger.exception(
-                                        "Watch out, there is an Exception incoming!"
-                                        + "Did you try to compensate for a not dynamic parameter?"
-                                    )
-                                    raise e
-                                comped_sweeps.append(self.dynamic_sweeps[comped_index])
-                                comped_leverarms.append(leverarms[k])
-                                self.active_compensated_channels.append(self.dynamic_channels[comped_index])
-                            k += 1
-                        compensating_param = self.compensating_parameters[i]
-                        self.active_compensating_parameters.append(compensating_param)
-                        if len(comped_params) > 0:
-                            self.active_compensating_channels.append(channel)
-                            for j in range(len(comped_params)):
-                                # Here we create lists/sweeps only containing the difference required for compensation.
-                                # Still has to be substracted from the set value in the measurement script as this can
-                                # depend on the measurement script used (e.g. 1D vs 2D sweeps)
-                                comping_setpoints = (
-                                    -1
-                                    * float(comped_leverarms[j])
-                                    * (np.array(comped_sweeps[j].get_setpoints()) - comped_sweeps[j].get_setpoints()[0])
-                                )
-                                # This creates an inner list of required setpoint differences only
-                                # for the param that is currently iterated over!
-                                # The final self.compensating_sweeps list will contain list for each
-                                # compensating parameters with one sweep per
-                                # parameter that is compensated by this compensating parameters.
-                                comping_sweeps.append(
-                                    CustomSweep(
-                                        channel,
-                                        comping_setpoints,
-                                        delay=self.properties[gate][parameter].setdefault("delay", 0),
-                                    )
+        for gate, parameter, channel, props, flags in self._flat_params:
+            # This iterates over all compensating parameters
+            if flags.is_compensating:
+                try:
+                    i = self.compensating_parameters.index({"gate": gate, "parameter": parameter})
+                    leverarms = self.compensating_leverarms[i]
+                    comped_params = copy.deepcopy(
+                        self.compensated_parameters[i]
+                    )  # list of parameters compensated by the current parameter
+                    comped_sweeps = []  # Sweeps that are compensated by current param
+                    comped_leverarms = []  # Leverarms of the current param
+                    comping_sweeps = []  # List to store only the sweeps for the current param
+                    k = 0
+                    for comped_param in comped_params.copy():
+                        # Check if the parameter is actually ramped in this part of the measurement
+                        if comped_param in inactive_dyn_params:
+                            comped_params.remove(comped_param)
+                        else:
+                            # Get only the relevant list entries for the current parameter
+                            try:
+                                comped_index = self.dynamic_parameters.index(comped_param)
+                            except ValueError as e:
+                                logger.exception(
+                                    "Watch out, there is an Exception incoming!"
+                                    + "Did you try to compensate for a not dynamic parameter?"
                                 )
-                            self.compensating_sweeps.append(comping_sweeps)
-                            if (
-                                any(
-                                    [
-                                        self.properties[param["gate"]][param["parameter"]].get("_is_triggered", False)
-                                        for param in comped_params
-                                    ]
+                                raise e
+                            comped_sweeps.append(self.dynamic_sweeps[comped_index])
+                            comped_leverarms.append(leverarms[k])
+                            self.active_compensated_channels.append(self.dynamic_channels[comped_index])
+                        k += 1
+                    compensating_param = self.compensating_parameters[i]
+                    self.active_compensating_parameters.append(compensating_param)
+                    if len(comped_params) > 0:
+                        self.active_compensating_channels.append(channel)
+                        for j in range(len(comped_params)):
+                            # Here we create lists/sweeps only containing the difference required for compensation.
+                            # Still has to be substracted from the set value in the measurement script as this can
+                            # depend on the measurement script used (e.g. 1D vs 2D sweeps)
+                            comping_setpoints = (
+                                -1
+                                * float(comped_leverarms[j])
+                                * (np.array(comped_sweeps[j].get_setpoints()) - comped_sweeps[j].get_setpoints()[0])
+                            )
+                            # This creates an inner list of required setpoint differences only
+                            # for the param that is currently iterated over!
+                            # The final self.compensating_sweeps list will contain list for each
+                            # compensating parameters with one sweep per
+                            # parameter that is compensated by this compensating parameters.
+                            comping_sweeps.append(
+                                CustomSweep(
+                                    channel,
+                                    comping_setpoints,
+                                    delay=props.setdefault("delay", 0),
                                 )
-                                and self.buffered
-                            ):
-                                self.properties[compensating_param["gate"]][compensating_param["parameter"]][
-                                    "_is_triggered"
-                                ] = True
-                            # TODO: This part has to be moved into the measurement script,
-                            # as the final setpoints for the comping params are now set at
-                            # the measurement script. A helper method would be nice to have.
-                            # if min(self.compensating_sweeps[-1].get_setpoints()) < min(*self.compensating_limits[i]) \
-                            #  or max(self.compensating_sweeps[-1].get_setpoints()) > max(*self.compensating_limits[i]):
-                            #     raise Exception(f"Value for compensating gate {compensating_param} exceeds limits!")
-                        ramp_or_set_parameter(
-                            channel,
-                            self.properties[gate][parameter]["value"],
-                            ramp_rate=ramp_rate,
-                            ramp_time=ramp_time,
-                            setpoint_intervall=setpoint_intervall,
-                        )
-                    except ValueError as e:
-                        raise e
+                            )
+                        self.compensating_sweeps.append(comping_sweeps)
+                        if (
+                            any(
+                                [
+                                    self.properties[param["gate"]][param["parameter"]].get("_is_triggered", False)
+                                    for param in comped_params
+                                ]
+                            )
+                            and self.buffered
+                        ):
+                            self.properties[compensating_param["gate"]][compensating_param["parameter"]][
+                                "_is_triggered"
+                            ] = True
+                        # TODO: This part has to be moved into the measurement script,
+                        # as the final setpoints for the comping params are now set at
+                        # the measurement script. A helper method would be nice to have.
+                        # if min(self.compensating_sweeps[-1].get_setpoints()) < min(*self.compensating_limits[i]) \
+                        #  or max(self.compensating_sweeps[-1].get_setpoints()) > max(*self.compensating_limits[i]):
+                        #     raise Exception(f"Value for compensating gate {compensating_param} exceeds limits!")
+                    ramp(channel, props["value"])
+                except ValueError as e:
+                    raise e
 
         if self.buffered:
-            for gettable_param in list(set(self.gettable_channels) - set(self.static_gettable_channels)):
-                if is_bufferable(gettable_param):
-                    gettable_param.root_instrument._qumada_buffer.subscribe([gettable_param])
-                else:
+            static_gettable_channels = set(self.static_gettable_channels)
+            for gettable_param in self.gettable_channels:
+                if gettable_param in static_gettable_channels:
+                    continue
+                if not is_bufferable(gettable_param):
                     raise Exception(f"{gettable_param} is not bufferable.")
+                gettable_param.root_instrument._qumada_buffer.subscribe([gettable_param])
 
     @abstractmethod
     def run(self) -> list:
@@ -735,38 +741,14 @@ class MeasurementScript(ABC):
         )
         ramp_rate = self.settings.get("ramp_rate", 0.3)
         setpoint_intervall = self.settings.get("setpoint_intervall", 0.1)
-        for gate, parameters in self.gate_parameters.items():
-            for parameter, channel in parameters.items():
-                if self.properties[gate][parameter]["type"].find("static") >= 0:
-                    ramp_or_set_parameter(
-                        channel,
-                        self.properties[gate][parameter]["value"],
-                        ramp_rate=ramp_rate,
-                        setpoint_intervall=setpoint_intervall,
-                    )
-                elif self.properties[gate][parameter]["type"].find("dynamic") >= 0:
-                    try:
-                        ramp_or_set_parameter(
-                            channel,
-                            self.properties[gate][parameter]["value"],
-                            ramp_rate=ramp_rate,
-                            setpoint_intervall=setpoint_intervall,
-                        )
-                    except KeyError:
-                        try:
-                            ramp_or_set_parameter(
-                                channel,
-                                self.properties[gate][parameter]["start"],
-                                ramp_rate=ramp_rate,
-                                setpoint_intervall=setpoint_intervall,
-                            )
-                        except KeyError:
-                            ramp_or_set_parameter(
-                                channel,
-                                self.properties[gate][parameter]["setpoints"][0],
-                                ramp_rate=ramp_rate,
-                                setpoint_intervall=setpoint_intervall,
-                            )
+        ramp = partial(ramp_or_set_parameter, ramp_rate=ramp_rate, setpoint_intervall=setpoint_intervall)
+        if not self._lists_created:
+            self._flatten_parameters()
+        for gate, parameter, channel, props, flags in self._flat_params:
+            if flags.is_static:
+                ramp(channel, props["value"])
+            elif flags.is_dynamic:
+                ramp(channel, _get_ramp_target(props))
 
     def clean_up(self, additional_actions: list[Callable] | None = None, **kwargs) -> None:
         """
@@ -818,9 +800,9 @@ class MeasurementScript(ABC):
             buffer.stop()
             data[buffer] = buffer.read()
             for param in buffer._subscribed_parameters:
-                results.append((param, flatten_array(data[buffer][param.name])))
+                results.append((param, _flatten_buffer_data(data[buffer][param.name])))
         if kwargs.get("timestamps", False):
-            results.append(flatten_array(data[list(data.keys())[0]]["timestamps"]))
+            results.append(_flatten_buffer_data(data[list(data.keys())[0]]["timestamps"]))
         return results
 
     def _relabel_instruments(self) -> None:
@@ -829,33 +811,42 @@ class MeasurementScript(ABC):
         corresponding name defined in the measurement script.
         Has to be done after mapping!
         """
-        for gate, parameters in self.gate_parameters.items():
-            for key, parameter in parameters.items():
-                parameter.label = f"{gate} {key}"
+        for gate, parameter, channel, _, _ in self._flat_params:
+            label = f"{gate} {parameter}"
+            if channel.label != label:
+                channel.label = label
 
-    def _add_current_datetime_to_metadata(self, *args, add_datetime_to_metadata: bool = True, **kwargs):
+    def _finalize_metadata(
+        self,
+        *args,
+        add_datetime_to_metadata: bool = True,
+        add_data_to_metadata: bool = True,
+        insert_metadata_into_db: bool = True,
+        **kwargs,
+    ):
+        """
+        Adds datetime and data location to the metadata and saves it, hooked onto run.
+        The metadata object is looked up once and saved once, after all fields are set.
+        """
+        if not (add_datetime_to_metadata or add_data_to_metadata or insert_metadata_into_db):
+            return
+        metadata = getattr(self, "metadata", None)
+        if metadata is None:
+            print("Metadata could not be updated: No metadata object was passed to setup.")
+            return
         if add_datetime_to_metadata:
             try:
-                metadata = self.metadata
                 metadata.add_datetime_to_metadata(datetime.now())
             except Exception as ex:
                 print(f"Datetime could not be added to metadata: {ex}")
-
-    def _add_data_to_metadata(self, *args, add_data_to_metadata: bool = True, **kwargs):
-        # Add script and parameters to metadata
         if add_data_to_metadata:
             try:
-                metadata = self.metadata
-                cls = type(self)
                 db_location = qc.config.core.db_location
-                metadata.add_data_to_metadata(db_location, "sqlite3", f"{cls.__name__}Data")
+                metadata.add_data_to_metadata(db_location, "sqlite3", f"{type(self).__name__}Data")
             except Exception as ex:
                 print(f"Data could not be added to metadata: {ex}")
-
-    def _insert_metadata_into_db(self, *args, insert_metadata_into_db: bool = True, **kwargs):
         if insert_metadata_into_db:
             try:
-                metadata = self.metadata
                 metadata.save()
             except Exception as ex:
                 print(f"Metadata could not inserted into database: {ex}")
@@ -895,8 +886,9 @@ class CustomSweep(AbstractSweep):
         post_actions: ActionsT = (),
     ):
         self._param = param
-        self._setpoints = setpoints
-        self._num_points = len(setpoints)
+        # Stored as contiguous float array, so lists are converted only once. Arrays of the right type are not copied.
+        self._setpoints = np.ascontiguousarray(setpoints, dtype=np.float64)
+        self._num_points = self._setpoints.shape[0]
         self._delay = delay
         self._post_actions = post_actions
 
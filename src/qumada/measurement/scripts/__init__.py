@@ -34,28 +34,29 @@ from .generic_measurement import (
     Timetrace_with_Sweeps_buffered,
 )
 
-try:
-    from .spectrometer import Measure_Spectrum
-except ModuleNotFoundError:
-    # Only relevant if you want to use spectrometer.
-    # Requires access to Bluhm Group GitLab
-    pass
-except ImportError:
-    pass
-
 __all__ = [
-    "Generic_1D_Sweep",
-    "Generic_1D_Sweep_buffered",
-    "Generic_nD_Sweep",
-    "Generic_1D_parallel_Sweep",
     "Generic_1D_Hysteresis_buffered",
     "Generic_1D_parallel_asymm_Sweep",
+    "Generic_1D_parallel_Sweep",
+    "Generic_1D_Sweep",
+    "Generic_1D_Sweep_buffered",
     "Generic_2D_Sweep_buffered",
+    "Generic_nD_Sweep",
     "Generic_Pulsed_Measurement",
     "Generic_Pulsed_Repeated_Measurement",
     "Timetrace",
-    "Timetrace_with_sweeps",
     "Timetrace_buffered",
+    "Timetrace_with_sweeps",
     "Timetrace_with_Sweeps_buffered",
-    "Measure_Spectrum",
 ]
+
+try:
+    from .spectrometer import Measure_Spectrum
+except ModuleNotFoundError:
+    # Only relevant if you want to use spectrometer.
+    # Requires access to Bluhm Group GitLab
+    pass
+except ImportError:
+    pass
+else:
+    __all__ += ["Measure_Spectrum"]
@@ -810,16 +810,17 @@ class Generic_1D_Hysteresis_buffered(MeasurementScript):
                 inactive_channels = [chan for chan in self.dynamic_channels if chan != dynamic_param]
                 self.initialize(inactive_dyn_channels=inactive_channels)
                 results = []
+                # Setpoints of both sweep directions are the same for every iteration
+                setpoints_up = dynamic_sweep.get_setpoints()
+                setpoints_down = setpoints_up[::-1]
 
                 for iiter in range(0, iterations):
                     self.ready_buffers()
                     if iiter % 2 == 0:
-                        set_points = dynamic_sweep.get_setpoints()
-                        end_value = dynamic_sweep.get_setpoints()[-1]
-
+                        set_points = setpoints_up
                     else:
-                        end_value = dynamic_sweep.get_setpoints()[0]
-                        set_points = list(reversed(dynamic_sweep.get_setpoints()))
+                        set_points = setpoints_down
+                    end_value = set_points[-1]
                     try:
                         dynamic_param.root_instrument._qumada_ramp(
                             [dynamic_param],
@@ -1400,6 +1401,10 @@ class Generic_Pulsed_Repeated_Measurement(MeasurementScript):
                 self.compensating_limits[index]
             ):
                 raise Exception(f"Setpoints of compensating gate {self.compensating_parameters[index]} exceed limits!")
+        # Pulse arguments do not change between repetitions
+        pulse_parameters = [*self.dynamic_channels, *self.active_compensating_channels]
+        pulse_setpoints = [*setpoints, *compensating_setpoints]
+        pulse_delay = self._burst_duration / self.buffered_num_points
         results = []
         with meas.run() as datasaver:
             for k in range(self.repetitions):
@@ -1412,9 +1417,9 @@ class Generic_Pulsed_Repeated_Measurement(MeasurementScript):
                 for instr in instruments:
                     try:
                         instr._qumada_pulse(
-                            parameters=[*self.dynamic_channels, *self.active_compensating_channels],
-                            setpoints=[*setpoints, *compensating_setpoints],
-                            delay=self._burst_duration / self.buffered_num_points,
+                            parameters=pulse_parameters,
+                            setpoints=pulse_setpoints,
+                            delay=pulse_delay,
                             sync_trigger=sync_trigger,
                         )
                     except AttributeError as ex:
@@ -23,18 +23,29 @@ from __future__ import annotations
 import importlib
 import pkgutil
 from contextlib import suppress
+from functools import lru_cache
 from types import ModuleType
 
 
 def import_submodules(package: str | ModuleType, recursive: bool = True) -> dict[str, ModuleType]:
     """Import all submodules of a module, recursively, including subpackages"""
-    if isinstance(package, str):
-        package = importlib.import_module(package)
+    if isinstance(package, ModuleType):
+        package = package.__name__
+    return dict(_import_submodules(package, recursive))
+
+
+@lru_cache(maxsize=None)
+def _import_submodules(package_name: str, recursive: bool) -> dict[str, ModuleType]:
+    """
+    Walks the package only once per process; already imported modules do not change.
+    Callers get a copy via import_submodules, so the cached dict is never mutated.
+    """
+    package = importlib.import_module(package_name)
     results = {}
     for loader, name, is_pkg in pkgutil.walk_packages(package.__path__):
         full_name = package.__name__ + "." + name
         with suppress(ValueError, ImportError):
             results[full_name] = importlib.import_module(full_name)
         if recursive and is_pkg:
-            results.update(import_submodules(full_name))
+            results.update(_import_submodules(full_name, True))
     return results
@@ -53,9 +53,11 @@ class ParameterDict(dict):
 def update_parameters(parameter_file_path: str | PathLike, new_parameters: ParameterDict):
     """Write or overwrite parameters to a file."""
     path = Path(parameter_file_path)
-    existing_parameters = json.load(path.open("r" if path.exists() else "x"), object_pairs_hook=ParameterDict)
+    with path.open("r" if path.exists() else "x") as file:
+        existing_parameters = json.load(file, object_pairs_hook=ParameterDict)
     parameters = existing_parameters | new_parameters
-    json.dump(parameters, path.open("w"), indent=2)
+    with path.open("w") as file:
+        json.dump(parameters, file, indent=2)
     return parameters
 
 
@@ -19,11 +19,17 @@
 
 
 # pylint: disable=missing-function-docstring
+from types import SimpleNamespace
+
 import pytest
+from pytest_mock import MockerFixture
+from pyvisa import VisaIOError
 from qcodes.instrument import Instrument, VisaInstrument
 from qcodes.parameters import Parameter
 from qcodes.tests.instrument_mocks import DummyInstrument
 
+from qumada.instrument.buffers import BufferException, MFLIBuffer, SR830Buffer
+from qumada.instrument.custom_drivers.Dummies.dummy_dac import DummyDac
 from qumada.instrument.instrument import is_instrument_class
 
 
@@ -43,3 +49,103 @@ def test_is_instrument(cls, expected: bool):
 def test_mfli_driver():
     MFLI = pytest.importorskip("qumada.instrument.custom_drivers.ZI.MFLI")
     assert is_instrument_class(MFLI.MFLI)
+
+
+def test_dummy_dac_trigger_events_are_independent():
+    dac1 = DummyDac("dac1")
+    dac2 = DummyDac("dac2")
+    try:
+        assert dac1._is_triggered is not dac2._is_triggered
+        dac1.force_trigger()
+        assert not dac2._is_triggered.is_set()
+    finally:
+        dac1.close()
+        dac2.close()
+
+
+def test_dummy_dac_triggered_ramp_ignores_stale_trigger():
+    dac = DummyDac("dac")
+    try:
+        dac.force_trigger()  # stale trigger, sent before the ramp is armed
+        dac._triggered_ramp(dac.ch01, 0.0, 1.0, 0.1, 10, trigger_timeout=0.2)
+        dac.thread.join(timeout=2)
+        assert not dac.thread.is_alive()
+        assert dac.ch01.voltage() == 0.0
+    finally:
+        dac.close()
+
+
+def test_dummy_dac_triggered_ramp():
+    dac = DummyDac("dac")
+    try:
+        dac._triggered_ramp(dac.ch01, 0.0, 1.0, 0.1, 100)
+        dac.force_trigger()
+        dac.thread.join(timeout=2)
+        assert dac.ch01.voltage() == pytest.approx(1.0)
+    finally:
+        dac.close()
+
+
+def test_dummy_dac_stop_ramp_joins_waiting_thread():
+    dac = DummyDac("dac")
+    try:
+        dac._triggered_ramp(dac.ch01, 0.0, 1.0, 0.1, 10)
+        thread = dac.thread
+        assert thread.is_alive()
+        dac.stop_ramp()
+        assert not thread.is_alive()
+        assert dac.ch01.voltage() == 0.0
+    finally:
+        dac.close()
+
+
+def test_sr830_buffer_trigger_unchanged_on_visa_error(mocker: MockerFixture):
+    device = mocker.MagicMock()
+    buffer = SR830Buffer(device)
+    buffer.trigger = "trig_in_1"
+    device.buffer_trig_mode.side_effect = VisaIOError(-1073807339)
+    with pytest.raises(BufferException):
+        buffer.trigger = "external"
+    assert buffer.trigger == "trig_in_1"
+
+
+class _FakeSampleNodes:
+    """Sample nodes of a demodulator, their string representation is the node path."""
+
+    def __getattr__(self, name: str) -> str:
+        return f"/dev1234/demods/0/sample.{name}"
+
+
+def test_mfli_buffer_subscribe_read_unsubscribe(mocker: MockerFixture):
+    NodeDict = pytest.importorskip("zhinst.toolkit.nodetree.helper").NodeDict
+    mfli = mocker.MagicMock()
+    mfli.instr.demods = [SimpleNamespace(sample=_FakeSampleNodes())]
+    daq = mfli.session.modules.daq
+    buffer = MFLIBuffer(mfli)
+    x, y = (Parameter(name, set_cmd=None) for name in ("x", "y"))
+    x.signal_name, y.signal_name = ("demod0", "x"), ("demod0", "y")
+
+    buffer.subscribe([x, y, x])
+    assert buffer._subscribed_parameters == [x, y]
+    assert daq.subscribe.call_count == 2
+
+    def sample(value, time):
+        return [SimpleNamespace(value=value, time=time)]
+
+    daq.read.return_value = NodeDict(
+        {
+            "/dev1234/demods/0/sample.y": sample([3, 4], [0, 1]),
+            "/dev1234/demods/0/sample.x": sample([1, 2], [0, 1]),
+            "/dev1234/demods/0/sample.r": sample([9, 9], [0, 1]),
+        }
+    )
+    data = buffer.read()
+    assert data.keys() == {"x", "y", "timestamps"}
+    assert list(data["x"]) == [1, 2]
+    assert list(data["y"]) == [3, 4]
+    assert list(data["timestamps"]) == [0, 1]
+
+    buffer.unsubscribe(buffer._subscribed_parameters)
+    assert not buffer.is_subscribed(x)
+    assert buffer._subscribed_parameters == []
+    assert daq.unsubscribe.call_count == 2